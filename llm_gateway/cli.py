@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 import typer
 import uvicorn
 
@@ -9,6 +11,21 @@ from llm_gateway.config import settings
 
 app = typer.Typer(name="llm-gateway", help="LLM Gateway - Unified LLM interface proxy")
 
+# uvloop is not available on Windows; httptools ships with uvicorn[standard] everywhere.
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+UVICORN_HTTP = "httptools"
+
+
+def server_keep_alive() -> int:
+    """Idle keep-alive timeout for the controller and worker servers.
+
+    Every client pool expires idle connections after HTTP_KEEPALIVE_EXPIRY,
+    so servers holding them a little longer never close a connection a
+    client is about to reuse. Set HTTP_KEEPALIVE_EXPIRY to the same value
+    on the controller and the workers.
+    """
+    return int(settings.http_keepalive_expiry) + 5
+
 
 @app.command()
 def controller(
@@ -27,6 +44,9 @@ def controller(
         host=host,
         port=port,
         log_level=log_level,
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+        timeout_keep_alive=server_keep_alive(),
         reload=False,
     )
 
@@ -86,6 +106,13 @@ def worker(
         host=host,
         port=port,
         log_level=log_level,
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+        # No limit_concurrency: uvicorn counts idle keep-alive connections
+        # against it, and the controller pool holds many of those. Load is
+        # shed by chat_completions' own capacity check instead.
+        backlog=2048,
+        timeout_keep_alive=server_keep_alive(),
         reload=False,
     )
 
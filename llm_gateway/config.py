@@ -29,6 +29,17 @@ class Settings(BaseSettings):
     )
     max_tokens: int = Field(default=4096, description="Default max tokens")
 
+    # HTTP client pool settings
+    http_max_connections: int = Field(
+        default=100, description="Maximum connections per HTTP client pool"
+    )
+    http_max_keepalive_connections: int = Field(
+        default=20, description="Maximum idle keep-alive connections per HTTP client pool"
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0, description="Seconds an idle keep-alive connection is retained"
+    )
+
     # Controller settings
     controller_host: str = Field(
         default="0.0.0.0", description="Controller server host"
@@ -41,7 +52,13 @@ class Settings(BaseSettings):
         default=60, description="Seconds before worker considered stale"
     )
     heartbeat_check_interval: int = Field(
-        default=10, description="Interval to check worker heartbeats"
+        default=10, description="Interval to re-probe workers whose heartbeat timed out"
+    )
+    controller_max_connections: int = Field(
+        default=1000, description="Maximum connections from the controller to all workers"
+    )
+    controller_max_keepalive_connections: int = Field(
+        default=100, description="Maximum idle keep-alive connections to workers"
     )
 
     # Worker settings
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import time
 from typing import Literal
 
 import structlog
@@ -22,8 +22,9 @@ class CircuitBreaker:
         self.recovery_timeout = recovery_timeout
         self.state: Literal["closed", "open", "half_open"] = "closed"
         self.failure_count: int = 0
-        self.last_failure: datetime | None = None
-        self._last_state_change: datetime = datetime.utcnow()
+        # Monotonic time at which an open circuit may be probed again.
+        self._retry_after_ns: int = 0
+        self._last_state_change_ns: int = time.monotonic_ns()
 
     def record_success(self) -> None:
         """Record a successful operation."""
@@ -36,7 +37,7 @@ class CircuitBreaker:
     def record_failure(self) -> None:
         """Record a failed operation."""
         self.failure_count += 1
-        self.last_failure = datetime.utcnow()
+        self._retry_after_ns = time.monotonic_ns() + self.recovery_timeout * 1_000_000_000
 
         if self.state == "half_open":
             self._transition_to("open")
@@ -51,32 +52,23 @@ class CircuitBreaker:
 
     def is_available(self) -> bool:
         """Check if the circuit allows requests."""
-        if self.state == "closed":
+        if self.state != "open":
             return True
 
-        if self.state == "open":
-            if self._should_attempt_recovery():
-                self._transition_to("half_open")
-                logger.info("circuit_breaker_half_open")
-                return True
+        if time.monotonic_ns() < self._retry_after_ns:
             return False
 
+        self._transition_to("half_open")
+        logger.info("circuit_breaker_half_open")
         return True
 
-    def _should_attempt_recovery(self) -> bool:
-        """Check if enough time has passed to attempt recovery."""
-        if self.last_failure is None:
-            return True
-        elapsed = datetime.utcnow() - self.last_failure
-        return elapsed >= timedelta(seconds=self.recovery_timeout)
-
     def _transition_to(self, new_state: Literal["closed", "open", "half_open"]) -> None:
         """Transition to a new state."""
         self.state = new_state
-        self._last_state_change = datetime.utcnow()
+        self._last_state_change_ns = time.monotonic_ns()
         if new_state == "closed":
             self.failure_count = 0
-            self.last_failure = None
+            self._retry_after_ns = 0
 
     def reset(self) -> None:
         """Reset the circuit breaker to closed state."""
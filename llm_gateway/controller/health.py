@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+import time
 from typing import TYPE_CHECKING
 
 import httpx
@@ -14,6 +14,15 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Bound connect separately so one unreachable worker cannot stall a probe round.
+_PROBE_TIMEOUT = httpx.Timeout(4.0, connect=1.0)
+# Keep idle probe connections longer than the re-probe interval so they get reused.
+_PROBE_LIMITS = httpx.Limits(
+    max_connections=512,
+    max_keepalive_connections=256,
+    keepalive_expiry=60.0,
+)
+
 
 class HealthChecker:
     """Background task to check worker health."""
@@ -24,6 +33,7 @@ class HealthChecker:
         heartbeat_timeout: int = 60,
         check_interval: int = 10,
         probe_failures_threshold: int = 3,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self._registry = registry
         self._heartbeat_timeout = heartbeat_timeout
@@ -32,12 +42,14 @@ class HealthChecker:
         self._probe_failures: dict[str, int] = {}
         self._running = False
         self._task: asyncio.Task | None = None
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = client
+        self._owns_client = client is None
 
     async def start(self) -> None:
         """Start the health check background task."""
         self._running = True
-        self._client = httpx.AsyncClient(timeout=5.0)
+        if self._owns_client:
+            self._client = httpx.AsyncClient(timeout=_PROBE_TIMEOUT, limits=_PROBE_LIMITS)
         self._task = asyncio.create_task(self._check_loop())
         logger.info("health_checker_started")
 
@@ -50,34 +62,67 @@ class HealthChecker:
                 await self._task
             except asyncio.CancelledError:
                 pass
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
         logger.info("health_checker_stopped")
 
     async def _check_loop(self) -> None:
-        """Main health check loop."""
+        """Main health check loop.
+
+        Sleeps until the earliest heartbeat deadline instead of polling at a
+        fixed rate. Heartbeats only push deadlines later and a newly
+        registered worker's deadline is at least ``heartbeat_timeout`` away,
+        so nothing can become due before the computed wake-up time.
+        """
         while self._running:
+            delay = float(self._check_interval)
             try:
-                await self._check_workers()
+                delay = await self._check_workers()
             except Exception as e:
                 logger.error("health_check_error", error=str(e))
 
-            await asyncio.sleep(self._check_interval)
+            await asyncio.sleep(delay)
 
-    async def _check_workers(self) -> None:
-        """Check all registered workers for heartbeat timeout."""
-        response = await self._registry.list_workers()
+    async def _check_workers(self) -> float:
+        """Check all registered workers for heartbeat timeout.
 
-        for worker_info in response.workers:
-            if worker_info.status == "draining":
-                continue
+        Returns:
+            Seconds until the next check is due.
+        """
+        now_ns = time.monotonic_ns()
+        timeout_ns = self._heartbeat_timeout * 1_000_000_000
+        next_deadline_ns = now_ns + timeout_ns
 
-            if worker_info.last_heartbeat is None:
+        timed_out = []
+        for worker in await self._registry.get_all_workers():
+            if worker.status == "draining":
                 continue
+            deadline_ns = worker.last_heartbeat_ns + timeout_ns
+            if deadline_ns <= now_ns:
+                timed_out.append(worker)
+            elif deadline_ns < next_deadline_ns:
+                next_deadline_ns = deadline_ns
+
+        delay = (next_deadline_ns - now_ns) / 1_000_000_000
+        if not timed_out:
+            return delay
+
+        results = await asyncio.gather(
+            *(self._handle_timeout(w.worker_id, w.endpoint) for w in timed_out),
+            return_exceptions=True,
+        )
+        for worker, result in zip(timed_out, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(
+                    "worker_timeout_handling_failed",
+                    worker_id=worker.worker_id,
+                    error=str(result),
+                )
 
-            elapsed = datetime.utcnow() - worker_info.last_heartbeat
-            if elapsed > timedelta(seconds=self._heartbeat_timeout):
-                await self._handle_timeout(worker_info.worker_id, worker_info.endpoint)
+        # Probing takes time; measure the wait from now, not from before it.
+        delay = max(0.0, (next_deadline_ns - time.monotonic_ns()) / 1_000_000_000)
+        # Workers that stay timed out are re-probed every check interval.
+        return min(delay, float(self._check_interval))
 
     async def _handle_timeout(self, worker_id: str, endpoint: str) -> None:
         """Handle a worker that has timed out."""
@@ -118,7 +163,7 @@ class HealthChecker:
             return False
 
         try:
-            response = await self._client.get(f"{endpoint}/health")
+            response = await self._client.get(f"{endpoint}/health", timeout=_PROBE_TIMEOUT)
             return response.status_code == 200
         except Exception as e:
             logger.debug("worker_probe_failed", endpoint=endpoint, error=str(e))
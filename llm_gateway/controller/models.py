@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Literal
 
 from pydantic import BaseModel
 
+from llm_gateway.controller.circuit_breaker import CircuitBreaker
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkerRecord:
     """Represents a registered worker in the registry."""
 
@@ -18,21 +21,32 @@ class WorkerRecord:
     endpoint: str
     status: Literal["healthy", "unhealthy", "draining"] = "healthy"
     last_heartbeat: datetime = field(default_factory=datetime.utcnow)
+    last_heartbeat_ns: int = field(default_factory=time.monotonic_ns)
     capacity: int = 10
+    # Update through set_load() so the cached load ratio used for routing stays in sync.
     current_load: int = 0
     metadata: dict[str, Any] = field(default_factory=dict)
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker, repr=False, compare=False)
+    _load_ratio: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Seed the cached load ratio from the initial load."""
+        self.set_load(self.current_load)
 
-    # Circuit breaker state
-    circuit_state: Literal["closed", "open", "half_open"] = "closed"
-    failure_count: int = 0
-    last_failure: datetime | None = None
+    def set_load(self, current_load: int) -> None:
+        """Update current load and the cached load ratio used for routing."""
+        self.current_load = current_load
+        self._load_ratio = current_load / self.capacity if self.capacity > 0 else float("inf")
+
+    @property
+    def circuit_state(self) -> Literal["closed", "open", "half_open"]:
+        """Return the current circuit breaker state."""
+        return self.breaker.state
 
     @property
     def load_ratio(self) -> float:
         """Return current load as ratio of capacity."""
-        if self.capacity <= 0:
-            return float("inf")
-        return self.current_load / self.capacity
+        return self._load_ratio
 
     @property
     def is_available(self) -> bool:
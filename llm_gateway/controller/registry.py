@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import asyncio
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, Literal
 
 import structlog
 
@@ -21,32 +21,47 @@ logger = structlog.get_logger()
 
 
 class WorkerRegistry:
-    """Registry for managing worker records."""
+    """Registry for managing worker records.
+
+    Every method runs to completion without awaiting, so mutations are atomic
+    on the event loop and no lock is needed.
+    """
 
     def __init__(self) -> None:
-        self._lock = asyncio.Lock()
         self._by_model: dict[str, dict[str, WorkerRecord]] = {}
         self._by_id: dict[str, WorkerRecord] = {}
+        # Healthy workers per model, rebuilt whenever membership or status changes
+        self._available_by_model: dict[str, tuple[WorkerRecord, ...]] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever worker membership changes."""
+        return self._version
 
     async def register_worker(self, record: WorkerRecord) -> None:
         """Register a new worker."""
-        async with self._lock:
-            if record.worker_id in self._by_id:
-                logger.info("worker_already_registered", worker_id=record.worker_id)
-                #raise ValueError(f"Worker {record.worker_id} already registered")
-
-            self._by_id[record.worker_id] = record
-
-            if record.model_id not in self._by_model:
-                self._by_model[record.model_id] = {}
-            self._by_model[record.model_id][record.worker_id] = record
-
-            logger.info(
-                "worker_registered",
-                worker_id=record.worker_id,
-                model_id=record.model_id,
-                endpoint=record.endpoint,
-            )
+        existing = self._by_id.get(record.worker_id)
+        if existing is not None:
+            logger.info("worker_already_registered", worker_id=record.worker_id)
+            #raise ValueError(f"Worker {record.worker_id} already registered")
+            if existing.model_id != record.model_id:
+                self._drop_from_model(existing.model_id, record.worker_id)
+
+        self._by_id[record.worker_id] = record
+
+        # Copy-on-write: a bucket already handed to a reader is never mutated.
+        bucket = self._by_model.get(record.model_id, {})
+        self._by_model[record.model_id] = {**bucket, record.worker_id: record}
+        self._reindex_available(record.model_id)
+        self._version += 1
+
+        logger.info(
+            "worker_registered",
+            worker_id=record.worker_id,
+            model_id=record.model_id,
+            endpoint=record.endpoint,
+        )
 
     async def unregister_worker(self, worker_id: str, force: bool = False) -> None:
         """Unregister a worker.
@@ -55,27 +70,34 @@ class WorkerRegistry:
             worker_id: Worker to unregister
             force: If True, immediately remove; if False, mark as draining
         """
-        async with self._lock:
-            record = self._by_id.get(worker_id)
-            if not record:
-                raise KeyError(f"Worker {worker_id} not found")
-
-            if force:
-                del self._by_id[worker_id]
-                if record.model_id in self._by_model:
-                    self._by_model[record.model_id].pop(worker_id, None)
-                    if not self._by_model[record.model_id]:
-                        del self._by_model[record.model_id]
-                logger.info("worker_removed", worker_id=worker_id)
-            else:
-                record.status = "draining"
-                logger.info("worker_draining", worker_id=worker_id)
-
-    async def get_workers_for_model(self, model_id: str) -> list[WorkerRecord]:
-        """Get all workers for a specific model."""
-        async with self._lock:
-            workers = self._by_model.get(model_id, {})
-            return list(workers.values())
+        record = self._by_id.get(worker_id)
+        if not record:
+            raise KeyError(f"Worker {worker_id} not found")
+
+        if force:
+            del self._by_id[worker_id]
+            self._drop_from_model(record.model_id, worker_id)
+            logger.info("worker_removed", worker_id=worker_id)
+        else:
+            record.status = "draining"
+            self._reindex_available(record.model_id)
+            logger.info("worker_draining", worker_id=worker_id)
+
+    async def get_workers_for_model(self, model_id: str) -> tuple[WorkerRecord, ...]:
+        """Get all workers for a specific model as a point-in-time snapshot."""
+        return tuple(self._by_model.get(model_id, {}).values())
+
+    async def get_available_workers(self, model_id: str) -> tuple[WorkerRecord, ...]:
+        """Get the healthy workers for a model from the pre-filtered index."""
+        return self._available_by_model.get(model_id, ())
+
+    async def list_model_ids(self) -> tuple[str, ...]:
+        """Get the IDs of all models with at least one registered worker."""
+        return tuple(self._by_model)
+
+    async def get_all_workers(self) -> tuple[WorkerRecord, ...]:
+        """Get all registered workers as a point-in-time snapshot."""
+        return tuple(self._by_id.values())
 
     async def update_heartbeat(
         self,
@@ -84,67 +106,88 @@ class WorkerRegistry:
         status: Literal["healthy", "unhealthy", "draining"],
     ) -> None:
         """Update worker heartbeat."""
-        async with self._lock:
-            record = self._by_id.get(worker_id)
-            if not record:
-                raise KeyError(f"Worker {worker_id} not found")
-
-            record.last_heartbeat = datetime.utcnow()
-            record.current_load = current_load
-            record.status = cast(Literal["healthy", "unhealthy", "draining"], status)
-            logger.debug(
-                "heartbeat_updated",
-                worker_id=worker_id,
-                current_load=current_load,
-                status=status,
-            )
+        record = self._by_id.get(worker_id)
+        if not record:
+            raise KeyError(f"Worker {worker_id} not found")
+
+        record.last_heartbeat = datetime.utcnow()
+        record.last_heartbeat_ns = time.monotonic_ns()
+        record.set_load(current_load)
+        if record.status != status:
+            record.status = status
+            self._reindex_available(record.model_id)
+        logger.debug(
+            "heartbeat_updated",
+            worker_id=worker_id,
+            current_load=current_load,
+            status=status,
+        )
 
     async def list_workers(self, model_id: str | None = None) -> WorkerListResponse:
-        """List all workers, optionally filtered by model."""
-        async with self._lock:
-            if model_id:
-                workers = self._by_model.get(model_id, {}).values()
-            else:
-                workers = self._by_id.values()
-
-            worker_infos = [
-                WorkerInfo(
-                    worker_id=w.worker_id,
-                    model_id=w.model_id,
-                    endpoint=w.endpoint,
-                    status=w.status,
-                    current_load=w.current_load,
-                    capacity=w.capacity,
-                    circuit_state=w.circuit_state,
-                    last_heartbeat=w.last_heartbeat,
-                )
-                for w in workers
-            ]
-
-            return WorkerListResponse(
-                workers=worker_infos,
-                total=len(worker_infos),
+        """List all workers, optionally filtered by model.
+
+        Records are registry-owned and already correctly typed, so the response
+        models are built with ``model_construct`` and skip validation.
+        """
+        workers = self._by_model.get(model_id, {}).values() if model_id else self._by_id.values()
+
+        worker_infos = [
+            WorkerInfo.model_construct(
+                worker_id=w.worker_id,
+                model_id=w.model_id,
+                endpoint=w.endpoint,
+                status=w.status,
+                current_load=w.current_load,
+                capacity=w.capacity,
+                circuit_state=w.circuit_state,
+                last_heartbeat=w.last_heartbeat,
             )
+            for w in workers
+        ]
+
+        return WorkerListResponse.model_construct(
+            workers=worker_infos,
+            total=len(worker_infos),
+        )
 
     async def get_worker(self, worker_id: str) -> WorkerRecord | None:
         """Get a specific worker by ID."""
-        async with self._lock:
-            return self._by_id.get(worker_id)
+        return self._by_id.get(worker_id)
 
     async def mark_unhealthy(self, worker_id: str) -> None:
         """Mark a worker as unhealthy."""
-        async with self._lock:
-            record = self._by_id.get(worker_id)
-            if record:
-                record.status = cast(Literal["healthy", "unhealthy", "draining"], "unhealthy")
-                logger.warning("worker_marked_unhealthy", worker_id=worker_id)
+        record = self._by_id.get(worker_id)
+        if record:
+            record.status = "unhealthy"
+            self._reindex_available(record.model_id)
+            logger.warning("worker_marked_unhealthy", worker_id=worker_id)
 
     async def remove_worker(self, worker_id: str) -> None:
         """Remove a worker from registry completely."""
-        async with self._lock:
-            record = self._by_id.pop(worker_id, None)
-            if record and record.model_id in self._by_model:
-                self._by_model[record.model_id].pop(worker_id, None)
-                if not self._by_model[record.model_id]:
-                    del self._by_model[record.model_id]
-            logger.info("worker_removed_from_registry", worker_id=worker_id)
+        record = self._by_id.pop(worker_id, None)
+        if record:
+            self._drop_from_model(record.model_id, worker_id)
+        logger.info("worker_removed_from_registry", worker_id=worker_id)
+
+    def _drop_from_model(self, model_id: str, worker_id: str) -> None:
+        """Remove a worker from its model bucket by swapping in a new dict."""
+        bucket = self._by_model.get(model_id)
+        if bucket is None:
+            return
+        remaining = {wid: w for wid, w in bucket.items() if wid != worker_id}
+        if remaining:
+            self._by_model[model_id] = remaining
+        else:
+            del self._by_model[model_id]
+        self._reindex_available(model_id)
+        self._version += 1
+
+    def _reindex_available(self, model_id: str) -> None:
+        """Rebuild the healthy-worker index for a model."""
+        available = tuple(
+            w for w in self._by_model.get(model_id, {}).values() if w.status == "healthy"
+        )
+        if available:
+            self._available_by_model[model_id] = available
+        else:
+            self._available_by_model.pop(model_id, None)
@@ -2,19 +2,36 @@
 
 from __future__ import annotations
 
+import random
+from collections import OrderedDict
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 import structlog
 
-from llm_gateway.controller.circuit_breaker import CircuitBreaker
 from llm_gateway.exceptions import LLMGatewayError
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from llm_gateway.controller.registry import WorkerRegistry
     from llm_gateway.controller.models import WorkerRecord
 
 logger = structlog.get_logger()
 
+_by_load_ratio = attrgetter("load_ratio")
+
+
+def _pick_less_loaded(candidates: list[WorkerRecord]) -> WorkerRecord:
+    """Pick the less loaded of two random candidates (power of two choices).
+
+    Sampling avoids sending a burst of requests to the same worker while
+    heartbeat-reported loads are stale.
+    """
+    if len(candidates) > 2:
+        candidates = random.sample(candidates, 2)
+    return min(candidates, key=_by_load_ratio)
+
 
 class NoWorkerAvailableError(LLMGatewayError):
     """No worker available for the requested model."""
@@ -39,43 +56,55 @@ class AllWorkersAtCapacityError(LLMGatewayError):
 class Router:
     """Routes requests to appropriate workers."""
 
-    def __init__(self, registry: WorkerRegistry) -> None:
+    def __init__(
+        self,
+        registry: WorkerRegistry,
+        max_sessions: int = 10_000,
+        affinity_load_threshold: float = 0.8,
+    ) -> None:
         self._registry = registry
-        self._circuit_breakers: dict[str, CircuitBreaker] = {}
-
-    def _get_circuit_breaker(self, worker_id: str) -> CircuitBreaker:
-        """Get or create circuit breaker for a worker."""
-        if worker_id not in self._circuit_breakers:
-            self._circuit_breakers[worker_id] = CircuitBreaker()
-        return self._circuit_breakers[worker_id]
-
-    async def select_worker(self, model_id: str) -> WorkerRecord:
-        """Select the best worker for a model using Least-Loaded strategy.
+        self._max_sessions = max_sessions
+        self._affinity_load_threshold = affinity_load_threshold
+        # (model_id, session_key) -> worker_id, least recently used first
+        self._sessions: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+    async def select_worker(
+        self,
+        model_id: str,
+        session_key: str | None = None,
+        exclude: Collection[str] = (),
+    ) -> WorkerRecord:
+        """Select a worker for a model using power-of-two-choices.
+
+        When a session key is given, the worker that last served the session
+        is preferred while its load ratio stays below the affinity threshold,
+        so the backend can reuse its prompt cache. Workers whose IDs are in
+        ``exclude`` are treated as being at capacity.
 
         Raises:
             NoWorkerAvailableError: No workers registered for the model
             AllWorkersAtCapacityError: All workers at full capacity
         """
-        workers = await self._registry.get_workers_for_model(model_id)
+        workers = await self._registry.get_available_workers(model_id)
 
-        if not workers:
-            raise NoWorkerAvailableError(model_id)
-
-        available_workers = []
-        for worker in workers:
-            cb = self._get_circuit_breaker(worker.worker_id)
-            if cb.is_available() and worker.status == "healthy":
-                available_workers.append(worker)
+        available_workers = [w for w in workers if w.breaker.is_available()]
 
         if not available_workers:
             raise NoWorkerAvailableError(model_id)
 
-        at_capacity = [w for w in available_workers if w.current_load < w.capacity]
+        below_capacity = [
+            w
+            for w in available_workers
+            if w.current_load < w.capacity and w.worker_id not in exclude
+        ]
 
-        if not at_capacity:
+        if not below_capacity:
             raise AllWorkersAtCapacityError(model_id)
 
-        selected = min(at_capacity, key=lambda w: w.load_ratio)
+        if session_key is None:
+            selected = _pick_less_loaded(below_capacity)
+        else:
+            selected = self._select_for_session(model_id, session_key, below_capacity)
         logger.debug(
             "worker_selected",
             worker_id=selected.worker_id,
@@ -84,12 +113,40 @@ class Router:
         )
         return selected
 
-    def record_success(self, worker_id: str) -> None:
+    def _select_for_session(
+        self, model_id: str, session_key: str, candidates: list[WorkerRecord]
+    ) -> WorkerRecord:
+        """Pick the session's sticky worker if it has headroom, else re-pin it."""
+        sessions = self._sessions
+        key = (model_id, session_key)
+        worker_id = sessions.get(key)
+        if worker_id is not None:
+            for worker in candidates:
+                if worker.worker_id == worker_id:
+                    if worker.load_ratio < self._affinity_load_threshold:
+                        sessions.move_to_end(key)
+                        return worker
+                    break
+
+        selected = _pick_less_loaded(candidates)
+        sessions[key] = selected.worker_id
+        sessions.move_to_end(key)
+        if len(sessions) > self._max_sessions:
+            sessions.popitem(last=False)
+        return selected
+
+    def record_success(self, worker: WorkerRecord) -> None:
         """Record a successful request to a worker."""
-        cb = self._get_circuit_breaker(worker_id)
-        cb.record_success()
+        worker.breaker.record_success()
+
+    def record_busy(self, worker: WorkerRecord) -> None:
+        """Record that a worker shed a request because it is at capacity.
+
+        The worker is treated as full until its next heartbeat reports its
+        real load; this is not a failure and leaves the circuit breaker alone.
+        """
+        worker.set_load(worker.capacity)
 
-    def record_failure(self, worker_id: str) -> None:
+    def record_failure(self, worker: WorkerRecord) -> None:
         """Record a failed request to a worker."""
-        cb = self._get_circuit_breaker(worker_id)
-        cb.record_failure()
+        worker.breaker.record_failure()
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import uuid
+import hmac
+import secrets
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 import structlog
 from fastapi import Depends, FastAPI, HTTPException, Query, Request
-from fastapi.responses import StreamingResponse
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
 
 from llm_gateway.config import settings
 from llm_gateway.controller.health import HealthChecker
@@ -35,39 +37,52 @@ from llm_gateway.models import (
     ModelListResponse,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from starlette.types import Receive, Scope, Send
+
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(settings.log_level),
+    cache_logger_on_first_use=True,
+)
 logger = structlog.get_logger()
-security = HTTPBearer(auto_error=False)
+_bound_contextvars = structlog.contextvars.bound_contextvars
+
+# Leading characters of the first user message used as the session key when no
+# X-Session-ID is sent.
+_SESSION_PREFIX_CHARS = 256
 
-registry: WorkerRegistry
-router: Router
-health_checker: HealthChecker
-client: httpx.AsyncClient
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Ask workers not to compress streams so raw chunks can be relayed untouched.
+_STREAM_HEADERS = {**_JSON_HEADERS, "Accept-Encoding": "identity"}
 
 
-async def verify_internal_api_key(
-    credentials: HTTPAuthorizationCredentials | None = Depends(security),
-) -> str | None:
-    """Verify internal API key if configured."""
-    if settings.internal_api_key is None:
+async def verify_internal_api_key(request: Request) -> str | None:
+    """Verify internal API key if configured.
+
+    Reads the Authorization header directly and compares in constant time.
+    """
+    expected = settings.internal_api_key
+    if expected is None:
         return None
 
-    if credentials is None:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
         raise HTTPException(status_code=401, detail="Missing authentication token")
 
-    if credentials.credentials != settings.internal_api_key:
+    if not hmac.compare_digest(token.encode(), expected.encode()):
         raise HTTPException(status_code=401, detail="Invalid authentication token")
 
-    return credentials.credentials
+    return token
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage application lifespan."""
-    global registry, router, health_checker, client
+    """Manage application lifespan.
 
-    structlog.configure(
-        wrapper_class=structlog.make_filtering_bound_logger(settings.log_level),
-    )
+    Shared components live on ``app.state``; handlers bind them to locals.
+    """
     logger.info(
         "controller_starting",
         host=settings.controller_host,
@@ -76,12 +91,27 @@ async def lifespan(app: FastAPI):
 
     registry = WorkerRegistry()
     router = Router(registry)
+    client = httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.default_timeout, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=settings.controller_max_connections,
+            max_keepalive_connections=settings.controller_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+    )
     health_checker = HealthChecker(
         registry=registry,
         heartbeat_timeout=settings.heartbeat_timeout,
         check_interval=settings.heartbeat_check_interval,
+        client=client,
     )
-    client = httpx.AsyncClient(timeout=settings.default_timeout)
+
+    app.state.registry = registry
+    app.state.router = router
+    app.state.health_checker = health_checker
+    app.state.client = client
+    # (registry version, response) for /v1/models
+    app.state.models_cache = None
 
     await health_checker.start()
     logger.info("health_checker_started")
@@ -104,9 +134,10 @@ app = FastAPI(
 @app.middleware("http")
 async def add_request_id(request: Request, call_next):
     """Add request ID to each request."""
-    request_id = str(uuid.uuid4())
-    structlog.contextvars.bind_contextvars(request_id=request_id)
-    response = await call_next(request)
+    request_id = secrets.token_hex(12)
+    request.state.request_id = request_id
+    with _bound_contextvars(request_id=request_id):
+        response = await call_next(request)
     response.headers["X-Request-ID"] = request_id
     return response
 
@@ -118,50 +149,52 @@ async def add_request_id(request: Request, call_next):
 
 @app.post("/internal/workers/register", status_code=201)
 async def register_worker(
-    request: WorkerRegisterRequest,
+    body: WorkerRegisterRequest,
+    request: Request,
     _: str | None = Depends(verify_internal_api_key),
 ) -> dict[str, Any]:
     """Register a new worker."""
     logger.info(
         "worker_registration_request",
-        worker_id=request.worker_id,
-        model_id=request.model_id,
+        worker_id=body.worker_id,
+        model_id=body.model_id,
     )
 
     record = WorkerRecord(
-        worker_id=request.worker_id,
-        model_id=request.model_id,
-        endpoint=request.endpoint,
-        capacity=request.capacity,
-        metadata=request.metadata,
+        worker_id=body.worker_id,
+        model_id=body.model_id,
+        endpoint=body.endpoint,
+        capacity=body.capacity,
+        metadata=body.metadata,
     )
 
     try:
-        await registry.register_worker(record)
+        await request.app.state.registry.register_worker(record)
     except ValueError as e:
         raise HTTPException(status_code=409, detail=str(e))
 
     return {
-        "worker_id": request.worker_id,
+        "worker_id": body.worker_id,
         "status": "registered",
     }
 
 
 @app.post("/internal/workers/heartbeat")
 async def worker_heartbeat(
-    request: WorkerHeartbeatRequest,
+    body: WorkerHeartbeatRequest,
+    request: Request,
     _: str | None = Depends(verify_internal_api_key),
 ) -> dict[str, str]:
     """Update worker heartbeat."""
     try:
-        await registry.update_heartbeat(
-            worker_id=request.worker_id,
-            current_load=request.current_load,
-            status=request.status,
+        await request.app.state.registry.update_heartbeat(
+            worker_id=body.worker_id,
+            current_load=body.current_load,
+            status=body.status,
         )
     except KeyError:
         raise HTTPException(
-            status_code=404, detail=f"Worker {request.worker_id} not found"
+            status_code=404, detail=f"Worker {body.worker_id} not found"
         )
 
     return {"status": "ok"}
@@ -169,22 +202,25 @@ async def worker_heartbeat(
 
 @app.get("/internal/workers", response_model=WorkerListResponse)
 async def list_workers(
+    request: Request,
     model_id: str | None = Query(default=None),
     _: str | None = Depends(verify_internal_api_key),
 ) -> WorkerListResponse:
     """List all registered workers."""
+    registry: WorkerRegistry = request.app.state.registry
     return await registry.list_workers(model_id=model_id)
 
 
 @app.delete("/internal/workers/{worker_id}")
 async def deregister_worker(
     worker_id: str,
+    request: Request,
     force: bool = Query(default=False),
     _: str | None = Depends(verify_internal_api_key),
 ) -> dict[str, str]:
     """Deregister a worker."""
     try:
-        await registry.unregister_worker(worker_id, force=force)
+        await request.app.state.registry.unregister_worker(worker_id, force=force)
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Worker {worker_id} not found")
 
@@ -196,87 +232,169 @@ async def deregister_worker(
 # ============================================================================
 
 
-@app.post("/v1/chat/completions", response_model=ChatCompletionResponse)
-async def chat_completions(
-    request: ChatCompletionRequest,
-) -> ChatCompletionResponse | StreamingResponse:
-    """Create chat completion by routing to a worker."""
-    request_id = str(uuid.uuid4())
-    logger.info(
-        "chat_completion_request",
-        model=request.model,
-        stream=request.stream,
-        request_id=request_id,
-    )
-
+@app.post(
+    "/v1/chat/completions",
+    response_model=None,
+    responses={200: {"model": ChatCompletionResponse}},
+)
+async def chat_completions(request: Request) -> Response:
+    """Create chat completion by routing to a worker.
+
+    The request is validated here, the only hop that does so, and then
+    forwarded verbatim; the worker response is relayed as-is. Worker 4xx
+    responses are the client's errors and are passed through without
+    counting against the worker's circuit breaker. A 503 means the worker is
+    shedding load, so the request is retried on another worker.
+    """
+    state = request.app.state
+    router: Router = state.router
+    client: httpx.AsyncClient = state.client
+
+    content = await request.body()
     try:
-        worker = await router.select_worker(request.model)
-    except NoWorkerAvailableError as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except AllWorkersAtCapacityError as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
+        body = ChatCompletionRequest.model_validate_json(content)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        ) from None
 
     logger.info(
-        "routing_to_worker",
-        worker_id=worker.worker_id,
-        endpoint=worker.endpoint,
+        "chat_completion_request",
+        model=body.model,
+        stream=body.stream,
+        request_id=request.state.request_id,
     )
 
-    try:
-        url = f"{worker.endpoint}/v1/chat/completions"
-
-        if request.stream:
-            return StreamingResponse(
-                _proxy_stream(url, request.model_dump(), worker.worker_id),
-                media_type="text/event-stream",
-                headers={"X-Request-ID": request_id},
-            )
-
-        response = await client.post(url, json=request.model_dump())
-        response.raise_for_status()
-        router.record_success(worker.worker_id)
-        return response.json()
-
-    except httpx.HTTPStatusError as e:
-        router.record_failure(worker.worker_id)
-        raise HTTPException(
-            status_code=e.response.status_code,
-            detail=str(e.response.text),
+    session_key = _session_key(request, body)
+    headers = _STREAM_HEADERS if body.stream else _JSON_HEADERS
+    busy: set[str] = set()
+    while True:
+        try:
+            worker = await router.select_worker(body.model, session_key, busy)
+        except NoWorkerAvailableError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.message)
+        except AllWorkersAtCapacityError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.message)
+
+        logger.info(
+            "routing_to_worker",
+            worker_id=worker.worker_id,
+            endpoint=worker.endpoint,
         )
-    except Exception as e:
-        router.record_failure(worker.worker_id)
-        logger.error("worker_request_failed", error=str(e))
-        raise HTTPException(status_code=502, detail=str(e))
+
+        # Streams are opened before responding so the worker's status is known.
+        worker_request = client.build_request(
+            "POST",
+            f"{worker.endpoint}/v1/chat/completions",
+            content=content,
+            headers=headers,
+        )
+        try:
+            response = await client.send(worker_request, stream=body.stream)
+        except Exception as e:
+            router.record_failure(worker)
+            logger.error("worker_request_failed", error=str(e))
+            raise HTTPException(status_code=502, detail=str(e))
+
+        if response.status_code != 503:
+            break
+        await response.aclose()
+        router.record_busy(worker)
+        busy.add(worker.worker_id)
+        logger.info("worker_busy", worker_id=worker.worker_id)
+
+    if response.is_success:
+        if body.stream:
+            return _UpstreamStreamingResponse(_proxy_stream(router, response, worker), response)
+        router.record_success(worker)
+        return Response(content=response.content, media_type="application/json")
+
+    if body.stream:
+        await response.aread()
+        await response.aclose()
+
+    if response.is_client_error:
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            media_type=response.headers.get("content-type"),
+        )
+
+    router.record_failure(worker)
+    raise HTTPException(status_code=response.status_code, detail=response.text)
+
+
+def _session_key(request: Request, body: ChatCompletionRequest) -> str | None:
+    """Derive the routing session key from X-Session-ID or the conversation.
+
+    Without the header, the conversation is identified by its first user
+    message rather than by ``messages[0]``, which is usually a system prompt
+    shared by every conversation of an application.
+    """
+    session_id = request.headers.get("x-session-id")
+    if session_id:
+        return session_id
+    for message in body.messages:
+        if message.role == "user":
+            return message.content[:_SESSION_PREFIX_CHARS] if message.content else None
+    return None
 
 
-async def _proxy_stream(url: str, payload: dict, worker_id: str):
-    """Proxy streaming response from worker."""
+async def _proxy_stream(
+    router: Router,
+    response: httpx.Response,
+    worker: WorkerRecord,
+):
+    """Relay an already opened streaming response from a worker."""
     try:
-        async with client.stream("POST", url, json=payload) as response:
-            response.raise_for_status()
-            async for chunk in response.aiter_bytes():
-                yield chunk
-        router.record_success(worker_id)
+        async for chunk in response.aiter_raw():
+            yield chunk
+        router.record_success(worker)
     except Exception as e:
-        router.record_failure(worker_id)
-        logger.error("stream_proxy_failed", worker_id=worker_id, error=str(e))
+        router.record_failure(worker)
+        logger.error("stream_proxy_failed", worker_id=worker.worker_id, error=str(e))
         raise
 
 
-@app.get("/v1/models", response_model=ModelListResponse)
-async def list_models() -> ModelListResponse:
-    """List all available models from workers."""
-    workers_response = await registry.list_workers()
-    models: dict[str, ModelInfo] = {}
+class _UpstreamStreamingResponse(StreamingResponse):
+    """Event stream that closes the worker response however the relay ends.
+
+    Closing here rather than in the relay generator also covers generators
+    that never start, e.g. when the client disconnects first.
+    """
+
+    def __init__(self, content: AsyncIterator[bytes], upstream: httpx.Response) -> None:
+        super().__init__(content, media_type="text/event-stream")
+        self._upstream = upstream
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self._upstream.aclose()
 
-    for worker_info in workers_response.workers:
-        if worker_info.model_id not in models:
-            models[worker_info.model_id] = ModelInfo(
-                id=worker_info.model_id,
-                owned_by="llm-gateway",
-            )
 
-    return ModelListResponse(data=list(models.values()))
+@app.get("/v1/models", response_model=ModelListResponse)
+async def list_models(request: Request) -> ModelListResponse:
+    """List all available models from workers.
+
+    The response is cached until worker membership changes.
+    """
+    state = request.app.state
+    registry: WorkerRegistry = state.registry
+    version = registry.version
+    cached: tuple[int, ModelListResponse] | None = state.models_cache
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    response = ModelListResponse(
+        data=[
+            ModelInfo(id=model_id, owned_by="llm-gateway")
+            for model_id in await registry.list_model_ids()
+        ]
+    )
+    state.models_cache = (version, response)
+    return response
 
 
 @app.get("/health")
@@ -304,11 +422,16 @@ def main() -> None:
     """Run the server."""
     import uvicorn
 
+    from llm_gateway.cli import UVICORN_HTTP, UVICORN_LOOP, server_keep_alive
+
     uvicorn.run(
         "llm_gateway.controller.server:app",
         host=settings.controller_host,
         port=settings.controller_port,
         log_level=settings.log_level.lower(),
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+        timeout_keep_alive=server_keep_alive(),
         reload=False,
     )
 
@@ -11,10 +11,16 @@ import structlog
 from llm_gateway.config import settings
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from llm_gateway.worker.registration import RegistrationClient
 
 logger = structlog.get_logger()
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Ask the backend not to compress streams so raw chunks can be relayed untouched.
+_STREAM_HEADERS = {**_JSON_HEADERS, "Accept-Encoding": "identity"}
+
 
 class ProxyHandler:
     """Handles proxying requests to backend."""
@@ -29,12 +35,26 @@ class ProxyHandler:
         self.registration_client = registration_client
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
+        # Capacity is the one concurrency limit: it bounds both the requests
+        # the worker admits and those it forwards to the backend at once.
+        self._semaphore = asyncio.Semaphore(registration_client.capacity)
 
     async def start(self) -> None:
-        """Initialize the HTTP client."""
+        """Initialize the HTTP client.
+
+        The pool is sized so capacity, not the pool, bounds backend
+        concurrency, and so a worker running at capacity keeps all its
+        connections warm between requests.
+        """
+        capacity = self.registration_client.capacity
         self._client = httpx.AsyncClient(
             base_url=self.backend_url,
-            timeout=self.timeout,
+            timeout=httpx.Timeout(self.timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=max(settings.http_max_connections, capacity),
+                max_keepalive_connections=max(settings.http_max_keepalive_connections, capacity),
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
         )
         logger.info("proxy_handler_started", backend_url=self.backend_url)
 
@@ -44,16 +64,46 @@ class ProxyHandler:
             await self._client.aclose()
         logger.info("proxy_handler_stopped")
 
-    async def proxy_chat_completion(self, payload: dict) -> dict:
-        """Proxy non-streaming chat completion request."""
-        if not self._client:
-            raise RuntimeError("Client not initialized")
+    def reserve_slot(self) -> Callable[[], None] | None:
+        """Claim a capacity slot for one request.
+
+        The capacity check and the claim run without an await in between, so
+        concurrent requests cannot both take the last slot.
+
+        Returns:
+            A callable that gives the slot back (safe to call more than once),
+            or None if the worker is at capacity.
+        """
+        registration_client = self.registration_client
+        if registration_client.current_load >= registration_client.capacity:
+            return None
+        registration_client.increment_load()
+        released = False
 
-        self.registration_client.increment_load()
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                registration_client.decrement_load()
+
+        return release
+
+    async def proxy_chat_completion(self, body: bytes, release: Callable[[], None]) -> bytes:
+        """Proxy non-streaming chat completion request.
+
+        The request body and the backend's JSON response are passed through
+        as raw bytes. ``release`` is the slot from :meth:`reserve_slot`.
+        """
         try:
-            response = await self._client.post("/v1/chat/completions", json=payload)
+            if not self._client:
+                raise RuntimeError("Client not initialized")
+
+            async with self._semaphore:
+                response = await self._client.post(
+                    "/v1/chat/completions", content=body, headers=_JSON_HEADERS
+                )
             response.raise_for_status()
-            return response.json()
+            return response.content
         except httpx.HTTPStatusError as e:
             logger.error(
                 "backend_error",
@@ -65,20 +115,27 @@ class ProxyHandler:
             logger.error("backend_timeout")
             raise
         finally:
-            self.registration_client.decrement_load()
+            release()
 
-    async def proxy_chat_completion_stream(self, payload: dict):
-        """Proxy streaming chat completion request."""
-        if not self._client:
-            raise RuntimeError("Client not initialized")
+    async def proxy_chat_completion_stream(self, body: bytes, release: Callable[[], None]):
+        """Proxy streaming chat completion request.
 
-        self.registration_client.increment_load()
+        ``release`` is the slot from :meth:`reserve_slot`. It is given back
+        once the stream ends; a stream that never starts is released by the
+        response instead.
+        """
         try:
-            async with self._client.stream(
-                "POST", "/v1/chat/completions", json=payload
-            ) as response:
+            if not self._client:
+                raise RuntimeError("Client not initialized")
+
+            async with (
+                self._semaphore,
+                self._client.stream(
+                    "POST", "/v1/chat/completions", content=body, headers=_STREAM_HEADERS
+                ) as response,
+            ):
                 response.raise_for_status()
-                async for chunk in response.aiter_bytes():
+                async for chunk in response.aiter_raw():
                     yield chunk
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -91,7 +148,7 @@ class ProxyHandler:
             logger.error("backend_stream_timeout")
             raise
         finally:
-            self.registration_client.decrement_load()
+            release()
 
     async def check_backend_health(self) -> tuple[bool, str]:
         """Check if backend is healthy."""
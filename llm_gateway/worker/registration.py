@@ -16,6 +16,9 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Deregistration is best-effort; never let an unreachable controller hold up exit.
+_DEREGISTER_TIMEOUT = 3.0
+
 
 class RegistrationClient:
     """Client for worker registration with controller."""
@@ -41,14 +44,42 @@ class RegistrationClient:
         self.retry_delay = retry_delay
 
         self._client: httpx.AsyncClient | None = None
-        self._current_load: int = 0
+        # In-flight load is _started - _finished; both only ever increase.
+        self._started: int = 0
+        self._finished: int = 0
         self._running: bool = False
         self._heartbeat_task: asyncio.Task | None = None
         self._registered: bool = False
 
+        # Requests are fixed for the client's lifetime; build them once.
+        self._headers = self._get_headers()
+        self._register_url = f"{controller_url}/internal/workers/register"
+        self._heartbeat_url = f"{controller_url}/internal/workers/heartbeat"
+        self._deregister_url = f"{controller_url}/internal/workers/{worker_id}"
+        self._register_payload = {
+            "worker_id": worker_id,
+            "model_id": model_id,
+            "endpoint": f"http://localhost:{settings.listen_port}",
+            "capacity": capacity,
+            "metadata": {"backend_url": backend_url},
+        }
+        self._heartbeat_payload: dict[str, Any] = {
+            "worker_id": worker_id,
+            "current_load": 0,
+            "status": "healthy",
+        }
+
     async def start(self) -> None:
         """Start the registration client and register with controller."""
-        self._client = httpx.AsyncClient(timeout=10.0)
+        # Keep the controller connection open between heartbeats; the controller
+        # holds idle connections slightly longer than HTTP_KEEPALIVE_EXPIRY.
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=2,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+        )
         self._running = True
 
         await self._register_with_retry()
@@ -108,19 +139,10 @@ class RegistrationClient:
         if not self._client:
             raise RuntimeError("Client not initialized")
 
-        payload = {
-            "worker_id": self.worker_id,
-            "model_id": self.model_id,
-            "endpoint": f"http://localhost:{settings.listen_port}",
-            "capacity": self.capacity,
-            "metadata": {"backend_url": self.backend_url},
-        }
-
-        headers = self._get_headers()
         response = await self._client.post(
-            f"{self.controller_url}/internal/workers/register",
-            json=payload,
-            headers=headers,
+            self._register_url,
+            json=self._register_payload,
+            headers=self._headers,
         )
         logger.info(
             "registration_response",
@@ -136,10 +158,10 @@ class RegistrationClient:
             return
 
         try:
-            headers = self._get_headers()
             response = await self._client.delete(
-                f"{self.controller_url}/internal/workers/{self.worker_id}",
-                headers=headers,
+                self._deregister_url,
+                headers=self._headers,
+                timeout=_DEREGISTER_TIMEOUT,
             )
             response.raise_for_status()
             logger.info("worker_deregistered", worker_id=self.worker_id)
@@ -169,23 +191,20 @@ class RegistrationClient:
         if not self._client:
             return
 
-        payload = {
-            "worker_id": self.worker_id,
-            "current_load": self._current_load,
-            "status": "healthy",
-        }
+        current_load = self._started - self._finished
+        payload = self._heartbeat_payload
+        payload["current_load"] = current_load
 
-        headers = self._get_headers()
         response = await self._client.post(
-            f"{self.controller_url}/internal/workers/heartbeat",
+            self._heartbeat_url,
             json=payload,
-            headers=headers,
+            headers=self._headers,
         )
         response.raise_for_status()
         logger.debug(
             "heartbeat_sent",
             worker_id=self.worker_id,
-            current_load=self._current_load,
+            current_load=current_load,
         )
 
     def _get_headers(self) -> dict[str, str]:
@@ -197,13 +216,17 @@ class RegistrationClient:
 
     def increment_load(self) -> None:
         """Increment current load counter."""
-        self._current_load += 1
+        self._started += 1
 
     def decrement_load(self) -> None:
-        """Decrement current load counter."""
-        self._current_load = max(0, self._current_load - 1)
+        """Decrement current load counter.
+
+        Unmatched decrements are ignored so the load never goes negative.
+        """
+        if self._finished < self._started:
+            self._finished += 1
 
     @property
     def current_load(self) -> int:
         """Get current load."""
-        return self._current_load
+        return self._started - self._finished
@@ -3,35 +3,46 @@
 from __future__ import annotations
 
 import asyncio
-import signal
-import sys
-import uuid
+import gzip
+import secrets
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import httpx
 import structlog
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import from_json
 
 from llm_gateway.config import settings
 from llm_gateway.worker.proxy import ProxyHandler
 from llm_gateway.worker.registration import RegistrationClient
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from starlette.types import Receive, Scope, Send
+
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(settings.log_level),
+    cache_logger_on_first_use=True,
+)
 logger = structlog.get_logger()
 
+# Non-streaming completions at least this large are gzipped for clients that accept it.
+_GZIP_MIN_SIZE = 1024
+_GZIP_LEVEL = 5
+
 registration_client: RegistrationClient
 proxy_handler: ProxyHandler
-shutdown_event: asyncio.Event
+root_info: dict[str, Any]
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan."""
-    global registration_client, proxy_handler, shutdown_event
+    global registration_client, proxy_handler, root_info
 
-    structlog.configure(
-        wrapper_class=structlog.make_filtering_bound_logger(settings.log_level),
-    )
     logger.info(
         "worker_starting",
         worker_id=settings.worker_id,
@@ -42,6 +53,15 @@ async def lifespan(app: FastAPI):
     if not settings.worker_id or not settings.model_id or not settings.backend_url:
         raise RuntimeError("WORKER_ID, MODEL_ID, and BACKEND_URL must be set for worker mode")
 
+    # Everything but the load is fixed for the worker's lifetime.
+    root_info = {
+        "name": "LLM Gateway Worker",
+        "version": "0.1.0",
+        "worker_id": settings.worker_id,
+        "model_id": settings.model_id,
+        "capacity": settings.capacity,
+    }
+
     registration_client = RegistrationClient(
         worker_id=settings.worker_id,
         model_id=settings.model_id,
@@ -59,31 +79,14 @@ async def lifespan(app: FastAPI):
         timeout=settings.default_timeout,
     )
 
-    shutdown_event = asyncio.Event()
-
     await proxy_handler.start()
     await registration_client.start()
 
-    loop = asyncio.get_event_loop()
-    if sys.platform != "win32":
-        for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(
-                sig,
-                lambda: asyncio.create_task(_handle_shutdown()),
-            )
-
+    # SIGTERM/SIGINT are left to uvicorn, which runs the code below on shutdown.
     yield
 
     logger.info("worker_shutting_down")
-    shutdown_event.set()
-    await registration_client.stop()
-    await proxy_handler.stop()
-
-
-async def _handle_shutdown():
-    """Handle shutdown signal gracefully."""
-    logger.info("shutdown_signal_received")
-    shutdown_event.set()
+    await asyncio.gather(registration_client.stop(), proxy_handler.stop())
 
 
 app = FastAPI(
@@ -97,44 +100,100 @@ app = FastAPI(
 @app.middleware("http")
 async def add_request_id(request: Request, call_next):
     """Add request ID to each request."""
-    request_id = str(uuid.uuid4())
-    structlog.contextvars.bind_contextvars(request_id=request_id)
-    response = await call_next(request)
+    request_id = secrets.token_hex(12)
+    request.state.request_id = request_id
+    with structlog.contextvars.bound_contextvars(request_id=request_id):
+        response = await call_next(request)
     response.headers["X-Request-ID"] = request_id
     return response
 
 
 @app.post("/v1/chat/completions")
-async def chat_completions(request: Request) -> Any:
-    """Proxy chat completion request to backend."""
-    payload = await request.json()
+async def chat_completions(request: Request) -> Response:
+    """Proxy chat completion request to backend, forwarding the raw body.
+
+    The controller has already validated the request. Backend 4xx responses
+    are relayed unchanged; other backend failures become a 502.
+    """
+    body = await request.body()
+    try:
+        payload = from_json(body)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid JSON body: {e}") from None
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=422, detail="Request body must be a JSON object")
     stream = payload.get("stream", False)
 
-    request_id = str(uuid.uuid4())
     logger.info(
         "chat_completion_request",
         model=payload.get("model"),
         stream=stream,
-        request_id=request_id,
+        request_id=request.state.request_id,
     )
 
+    # Claim the slot now: a stream's generator only starts after we return.
+    release = proxy_handler.reserve_slot()
+    if release is None:
+        raise HTTPException(status_code=503, detail="Worker at capacity")
+
     try:
         if stream:
-            return StreamingResponse(
-                proxy_handler.proxy_chat_completion_stream(payload),
-                media_type="text/event-stream",
-                headers={"X-Request-ID": request_id},
+            return _SlotStreamingResponse(
+                proxy_handler.proxy_chat_completion_stream(body, release), release
             )
 
-        return await proxy_handler.proxy_chat_completion(payload)
+        content = await proxy_handler.proxy_chat_completion(body, release)
+        return _completion_response(request, content)
 
     except HTTPException:
         raise
+    except httpx.HTTPStatusError as e:
+        if e.response.is_client_error:
+            return Response(
+                content=e.response.content,
+                status_code=e.response.status_code,
+                media_type=e.response.headers.get("content-type"),
+            )
+        logger.error("chat_completion_error", error=str(e))
+        raise HTTPException(status_code=502, detail=str(e)) from e
     except Exception as e:
         logger.error("chat_completion_error", error=str(e))
         raise HTTPException(status_code=502, detail=str(e))
 
 
+class _SlotStreamingResponse(StreamingResponse):
+    """Event stream that gives back its capacity slot however the response ends.
+
+    The generator releases the slot when it finishes; this covers responses
+    whose generator never starts, e.g. when the client disconnects first.
+    """
+
+    def __init__(self, content: AsyncIterator[bytes], release: Callable[[], None]) -> None:
+        super().__init__(content, media_type="text/event-stream")
+        self._release = release
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._release()
+
+
+def _completion_response(request: Request, content: bytes) -> Response:
+    """Build a non-streaming completion response, gzipped when worthwhile.
+
+    Compression is applied here rather than by middleware so event streams
+    are never buffered for compression, whatever the Starlette version.
+    """
+    if len(content) >= _GZIP_MIN_SIZE and "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=gzip.compress(content, compresslevel=_GZIP_LEVEL),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(content=content, media_type="application/json")
+
+
 @app.get("/health")
 async def health_check() -> dict[str, Any]:
     """Health check endpoint."""
@@ -149,11 +208,4 @@ async def health_check() -> dict[str, Any]:
 @app.get("/")
 async def root() -> dict[str, Any]:
     """Root endpoint."""
-    return {
-        "name": "LLM Gateway Worker",
-        "version": "0.1.0",
-        "worker_id": settings.worker_id,
-        "model_id": settings.model_id,
-        "current_load": registration_client.current_load,
-        "capacity": settings.capacity,
-    }
+    return {**root_info, "current_load": registration_client.current_load}
@@ -0,0 +1,143 @@
+"""Tests for HealthChecker."""
+
+import asyncio
+
+import pytest
+
+from llm_gateway.controller.health import HealthChecker
+from llm_gateway.controller.models import WorkerRecord
+from llm_gateway.controller.registry import WorkerRegistry
+
+
+@pytest.fixture
+def registry():
+    """Create a fresh registry."""
+    return WorkerRegistry()
+
+
+@pytest.fixture
+def health_checker(registry):
+    """Create a health checker with a short heartbeat timeout."""
+    return HealthChecker(
+        registry=registry,
+        heartbeat_timeout=1,
+        check_interval=1,
+        probe_failures_threshold=2,
+    )
+
+
+async def _register_stale(registry, worker_id):
+    """Register a worker whose last heartbeat is well past the timeout."""
+    record = WorkerRecord(
+        worker_id=worker_id,
+        model_id="llama3",
+        endpoint=f"http://{worker_id}:8001",
+    )
+    record.last_heartbeat_ns -= 10 * 1_000_000_000
+    await registry.register_worker(record)
+    return record
+
+
+@pytest.mark.asyncio
+async def test_fresh_workers_are_not_probed(health_checker, registry):
+    """Test that workers with recent heartbeats are left alone."""
+    await registry.register_worker(
+        WorkerRecord(worker_id="worker-1", model_id="llama3", endpoint="http://w1")
+    )
+    probed = []
+
+    async def probe(endpoint):
+        probed.append(endpoint)
+        return True
+
+    health_checker._probe_worker = probe
+    await health_checker._check_workers()
+
+    assert probed == []
+
+
+@pytest.mark.asyncio
+async def test_timed_out_workers_are_probed_concurrently(health_checker, registry):
+    """Test that probes for timed-out workers run in parallel."""
+    await _register_stale(registry, "worker-1")
+    await _register_stale(registry, "worker-2")
+    in_flight = 0
+    max_in_flight = 0
+
+    async def probe(endpoint):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return False
+
+    health_checker._probe_worker = probe
+    await health_checker._check_workers()
+
+    assert max_in_flight == 2
+    for worker_id in ("worker-1", "worker-2"):
+        worker = await registry.get_worker(worker_id)
+        assert worker.status == "unhealthy"
+
+
+@pytest.mark.asyncio
+async def test_worker_removed_after_failed_probes(health_checker, registry):
+    """Test that a worker is removed once probe failures reach the threshold."""
+    await _register_stale(registry, "worker-1")
+
+    async def probe(endpoint):
+        return False
+
+    health_checker._probe_worker = probe
+    await health_checker._check_workers()
+    assert await registry.get_worker("worker-1") is not None
+
+    await health_checker._check_workers()
+    assert await registry.get_worker("worker-1") is None
+
+
+@pytest.mark.asyncio
+async def test_next_check_scheduled_at_earliest_deadline(registry):
+    """Test that the loop sleeps until the earliest heartbeat deadline."""
+    health_checker = HealthChecker(registry=registry, heartbeat_timeout=60, check_interval=10)
+    record = WorkerRecord(worker_id="worker-1", model_id="llama3", endpoint="http://w1")
+    record.last_heartbeat_ns -= 45 * 1_000_000_000
+    await registry.register_worker(record)
+
+    delay = await health_checker._check_workers()
+
+    assert 14 < delay <= 15
+
+
+@pytest.mark.asyncio
+async def test_timed_out_workers_reprobed_at_check_interval(health_checker, registry):
+    """Test that timed-out workers cap the delay at the check interval."""
+    await _register_stale(registry, "worker-1")
+
+    async def probe(endpoint):
+        return False
+
+    health_checker._probe_worker = probe
+    delay = await health_checker._check_workers()
+
+    assert 0.9 < delay <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_probe_time_is_subtracted_from_next_delay(registry):
+    """Test that slow probes do not push the next check past a deadline."""
+    health_checker = HealthChecker(registry=registry, heartbeat_timeout=60, check_interval=10)
+    for worker_id, age in (("worker-1", 70), ("worker-2", 55)):
+        record = WorkerRecord(worker_id=worker_id, model_id="llama3", endpoint="http://w")
+        record.last_heartbeat_ns -= age * 1_000_000_000
+        await registry.register_worker(record)
+
+    async def probe(endpoint):
+        await asyncio.sleep(0.2)
+        return False
+
+    health_checker._probe_worker = probe
+    delay = await health_checker._check_workers()
+
+    assert 4.5 < delay <= 4.8
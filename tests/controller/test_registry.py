@@ -106,6 +106,7 @@ async def test_update_heartbeat(registry, sample_worker):
 
     worker = await registry.get_worker("test-worker-001")
     assert worker.current_load == 5
+    assert worker.load_ratio == 0.5
 
 
 @pytest.mark.asyncio
@@ -161,3 +162,62 @@ async def test_draining_worker(registry, sample_worker):
     worker = await registry.get_worker("test-worker-001")
     assert worker is not None
     assert worker.status == "draining"
+
+
+@pytest.mark.asyncio
+async def test_available_workers_index(registry, sample_worker):
+    """Test that only healthy workers appear in the available index."""
+    await registry.register_worker(sample_worker)
+    available = await registry.get_available_workers("llama3")
+    assert [w.worker_id for w in available] == ["test-worker-001"]
+
+    await registry.mark_unhealthy("test-worker-001")
+    assert await registry.get_available_workers("llama3") == ()
+
+    await registry.update_heartbeat(
+        worker_id="test-worker-001",
+        current_load=0,
+        status="healthy",
+    )
+    assert len(await registry.get_available_workers("llama3")) == 1
+
+    await registry.unregister_worker("test-worker-001", force=False)
+    assert await registry.get_available_workers("llama3") == ()
+
+
+@pytest.mark.asyncio
+async def test_reregister_worker_with_new_model(registry, sample_worker):
+    """Test that re-registering under another model leaves no stale entry."""
+    await registry.register_worker(sample_worker)
+    await registry.register_worker(
+        WorkerRecord(
+            worker_id="test-worker-001",
+            model_id="mistral",
+            endpoint="http://localhost:8001",
+        )
+    )
+
+    assert await registry.get_workers_for_model("llama3") == ()
+    assert await registry.get_available_workers("llama3") == ()
+    assert len(await registry.get_workers_for_model("mistral")) == 1
+
+
+@pytest.mark.asyncio
+async def test_version_tracks_membership(registry, sample_worker):
+    """Test that the version changes with membership but not heartbeats."""
+    initial = registry.version
+    await registry.register_worker(sample_worker)
+    assert registry.version != initial
+    assert await registry.list_model_ids() == ("llama3",)
+
+    registered = registry.version
+    await registry.update_heartbeat(
+        worker_id="test-worker-001",
+        current_load=3,
+        status="healthy",
+    )
+    assert registry.version == registered
+
+    await registry.remove_worker("test-worker-001")
+    assert registry.version != registered
+    assert await registry.list_model_ids() == ()
@@ -94,7 +94,7 @@ async def test_select_worker_respects_circuit_breaker(router, registry):
     await registry.register_worker(worker2)
 
     for _ in range(5):
-        router.record_failure("worker-1")
+        router.record_failure(worker1)
 
     selected = await router.select_worker("llama3")
     assert selected.worker_id == "worker-2"
@@ -103,8 +103,91 @@ async def test_select_worker_respects_circuit_breaker(router, registry):
 @pytest.mark.asyncio
 async def test_record_success_and_failure(router):
     """Test recording success and failure."""
-    router.record_success("any-worker")
-    router.record_failure("any-worker")
+    worker = WorkerRecord(
+        worker_id="any-worker",
+        model_id="llama3",
+        endpoint="http://localhost:8001",
+    )
+    router.record_success(worker)
+    router.record_failure(worker)
+
+    assert worker.breaker.failure_count == 1
+
+
+@pytest.mark.asyncio
+async def test_select_worker_session_affinity(router, registry):
+    """Test that a session sticks to its worker until it is heavily loaded."""
+    worker1 = WorkerRecord(
+        worker_id="worker-1",
+        model_id="llama3",
+        endpoint="http://localhost:8001",
+        capacity=10,
+    )
+    worker2 = WorkerRecord(
+        worker_id="worker-2",
+        model_id="llama3",
+        endpoint="http://localhost:8002",
+        capacity=10,
+    )
+    await registry.register_worker(worker1)
+    await registry.register_worker(worker2)
+
+    first = await router.select_worker("llama3", session_key="session-a")
+    other = worker2 if first is worker1 else worker1
+
+    first.set_load(5)
+    assert await router.select_worker("llama3", session_key="session-a") is first
+    assert await router.select_worker("llama3") is other
 
-    cb = router._get_circuit_breaker("any-worker")
-    assert cb.failure_count == 1
+    first.set_load(8)
+    assert await router.select_worker("llama3", session_key="session-a") is other
+    assert await router.select_worker("llama3", session_key="session-a") is other
+
+
+@pytest.mark.asyncio
+async def test_select_worker_never_picks_most_loaded(router, registry):
+    """Test that power-of-two-choices never picks the most loaded of several workers."""
+    for i, load in enumerate([0, 3, 6]):
+        await registry.register_worker(
+            WorkerRecord(
+                worker_id=f"worker-{i}",
+                model_id="llama3",
+                endpoint=f"http://localhost:800{i}",
+                capacity=10,
+                current_load=load,
+            )
+        )
+
+    selected = {(await router.select_worker("llama3")).worker_id for _ in range(50)}
+
+    assert "worker-2" not in selected
+
+
+@pytest.mark.asyncio
+async def test_busy_worker_is_skipped_without_tripping_breaker(router, registry):
+    """Test that a worker shedding load is avoided but not treated as failed."""
+    worker1 = WorkerRecord(
+        worker_id="worker-1",
+        model_id="llama3",
+        endpoint="http://localhost:8001",
+        capacity=10,
+    )
+    worker2 = WorkerRecord(
+        worker_id="worker-2",
+        model_id="llama3",
+        endpoint="http://localhost:8002",
+        capacity=10,
+        current_load=5,
+    )
+    await registry.register_worker(worker1)
+    await registry.register_worker(worker2)
+
+    selected = await router.select_worker("llama3", exclude={"worker-1"})
+    assert selected.worker_id == "worker-2"
+
+    router.record_busy(worker1)
+    assert worker1.breaker.failure_count == 0
+    assert await router.select_worker("llama3") is worker2
+
+    with pytest.raises(AllWorkersAtCapacityError):
+        await router.select_worker("llama3", exclude={"worker-2"})
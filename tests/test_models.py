@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
+from pydantic import ValidationError
 
 from llm_gateway.models import (
     ChatCompletionRequest,
@@ -12,9 +15,85 @@ from llm_gateway.models import (
     ModelInfo,
     ModelListResponse,
     StreamChoice,
-    Usage,
 )
 
+_TOOL_CALLS = [
+    {
+        "id": "call_abc123",
+        "type": "function",
+        "function": {
+            "name": "get_weather",
+            "arguments": '{"location": "Beijing"}',
+        },
+    }
+]
+
+_WEATHER_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_weather",
+            "description": "Get weather for a location",
+            "parameters": {
+                "type": "object",
+                "properties": {"location": {"type": "string", "description": "City name"}},
+                "required": ["location"],
+            },
+        },
+    }
+]
+
+_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+_RESPONSE_JSON = """
+{
+    "id": "test-id",
+    "created": 1234567890,
+    "model": "gpt-4",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hello!"},
+            "finish_reason": "stop"
+        }
+    ],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+}
+"""
+
+_CHOICE_WITH_TOOL_CALLS_JSON = """
+{
+    "index": 0,
+    "message": {
+        "role": "assistant",
+        "tool_calls": [
+            {
+                "id": "call_abc123",
+                "type": "function",
+                "function": {"name": "get_weather", "arguments": "{\\"location\\": \\"Beijing\\"}"}
+            }
+        ]
+    },
+    "finish_reason": "tool_calls"
+}
+"""
+
+_STREAM_CHOICE_WITH_TOOL_CALLS_JSON = """
+{
+    "index": 0,
+    "delta": {
+        "tool_calls": [
+            {
+                "id": "call_abc123",
+                "type": "function",
+                "function": {"name": "get_weather", "arguments": "{\\"location\\":"}
+            }
+        ]
+    },
+    "finish_reason": "tool_calls"
+}
+"""
+
 
 def test_message_creation() -> None:
     """Test Message model creation."""
@@ -23,6 +102,28 @@ def test_message_creation() -> None:
     assert msg.content == "Hello"
 
 
+@pytest.fixture(scope="module")
+def req_schema() -> dict[str, Any]:
+    """Build the ChatCompletionRequest JSON schema once."""
+    return ChatCompletionRequest.model_json_schema()
+
+
+@pytest.mark.parametrize(
+    ("field", "expected"),
+    [
+        ("temperature", 0.7),
+        ("top_p", 1.0),
+        ("stream", False),
+        ("max_tokens", None),
+    ],
+)
+def test_chat_completion_request_schema_defaults(
+    req_schema: dict[str, Any], field: str, expected: Any
+) -> None:
+    """Test ChatCompletionRequest defaults advertised in the JSON schema."""
+    assert req_schema["properties"][field]["default"] == expected
+
+
 def test_chat_completion_request_defaults() -> None:
     """Test ChatCompletionRequest default values."""
     req = ChatCompletionRequest(model="gpt-4", messages=[])
@@ -34,28 +135,20 @@ def test_chat_completion_request_defaults() -> None:
 
 def test_chat_completion_request_validation() -> None:
     """Test ChatCompletionRequest validation."""
-    with pytest.raises(ValueError):
-        ChatCompletionRequest(model="gpt-4", temperature=3.0, messages=[])
+    with pytest.raises(ValidationError):
+        ChatCompletionRequest.model_validate_json(
+            '{"model": "gpt-4", "temperature": 3.0, "messages": []}'
+        )
 
-    with pytest.raises(ValueError):
-        ChatCompletionRequest(model="gpt-4", top_p=1.5, messages=[])
+    with pytest.raises(ValidationError):
+        ChatCompletionRequest.model_validate_json(
+            '{"model": "gpt-4", "top_p": 1.5, "messages": []}'
+        )
 
 
 def test_chat_completion_response() -> None:
     """Test ChatCompletionResponse model."""
-    response = ChatCompletionResponse(
-        id="test-id",
-        created=1234567890,
-        model="gpt-4",
-        choices=[
-            Choice(
-                index=0,
-                message={"role": "assistant", "content": "Hello!"},
-                finish_reason="stop",
-            )
-        ],
-        usage=Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
-    )
+    response = ChatCompletionResponse.model_validate_json(_RESPONSE_JSON)
 
     assert response.id == "test-id"
     assert len(response.choices) == 1
@@ -104,42 +197,18 @@ def test_message_with_tool_role() -> None:
 
 def test_message_with_tool_calls() -> None:
     """Test Message model with tool_calls."""
-    tool_calls = [
-        {
-            "id": "call_abc123",
-            "type": "function",
-            "function": {
-                "name": "get_weather",
-                "arguments": '{"location": "Beijing"}',
-            },
-        }
-    ]
-    msg = Message(role="assistant", content=None, tool_calls=tool_calls)
+    msg = Message(role="assistant", content=None, tool_calls=_TOOL_CALLS)
     assert msg.role == "assistant"
-    assert msg.tool_calls == tool_calls
+    assert msg.tool_calls == _TOOL_CALLS
     assert msg.tool_calls[0]["function"]["name"] == "get_weather"
 
 
 def test_chat_completion_request_with_tools() -> None:
     """Test ChatCompletionRequest with tools parameter."""
-    tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "get_weather",
-                "description": "Get weather for a location",
-                "parameters": {
-                    "type": "object",
-                    "properties": {"location": {"type": "string", "description": "City name"}},
-                    "required": ["location"],
-                },
-            },
-        }
-    ]
     req = ChatCompletionRequest(
         model="gpt-4",
         messages=[Message(role="user", content="What's the weather?")],
-        tools=tools,
+        tools=_WEATHER_TOOLS,
     )
     assert req.tools is not None
     assert len(req.tools) == 1
@@ -168,9 +237,9 @@ def test_chat_completion_request_with_response_format() -> None:
     req = ChatCompletionRequest(
         model="gpt-4",
         messages=[Message(role="user", content="Give me JSON")],
-        response_format={"type": "json_object"},
+        response_format=_JSON_OBJECT_FORMAT,
     )
-    assert req.response_format == {"type": "json_object"}
+    assert req.response_format == _JSON_OBJECT_FORMAT
 
     req2 = ChatCompletionRequest(
         model="gpt-4",
@@ -185,43 +254,15 @@ def test_chat_completion_request_with_response_format() -> None:
 
 def test_choice_with_tool_calls() -> None:
     """Test Choice model with tool_calls in message."""
-    message_with_tool_calls = {
-        "role": "assistant",
-        "tool_calls": [
-            {
-                "id": "call_abc123",
-                "type": "function",
-                "function": {
-                    "name": "get_weather",
-                    "arguments": '{"location": "Beijing"}',
-                },
-            }
-        ],
-    }
-    choice = Choice(
-        index=0,
-        message=message_with_tool_calls,
-        finish_reason="tool_calls",
-    )
+    choice = Choice.model_validate_json(_CHOICE_WITH_TOOL_CALLS_JSON)
     assert choice.finish_reason == "tool_calls"
     assert choice.message["tool_calls"][0]["function"]["name"] == "get_weather"
+    assert choice.message["tool_calls"][0]["function"]["arguments"] == '{"location": "Beijing"}'
 
 
 def test_stream_choice_with_tool_calls() -> None:
     """Test StreamChoice model with tool_calls."""
-    delta = {
-        "tool_calls": [
-            {
-                "id": "call_abc123",
-                "type": "function",
-                "function": {
-                    "name": "get_weather",
-                    "arguments": '{"location":',
-                },
-            }
-        ]
-    }
-    choice = StreamChoice(index=0, delta=delta, finish_reason="tool_calls")
+    choice = StreamChoice.model_validate_json(_STREAM_CHOICE_WITH_TOOL_CALLS_JSON)
     assert choice.finish_reason == "tool_calls"
     assert choice.delta["tool_calls"][0]["function"]["name"] == "get_weather"
 
@@ -241,15 +282,14 @@ def test_message_serialization_with_tool_fields() -> None:
 
 def test_request_serialization_passes_through() -> None:
     """Test ChatCompletionRequest serialization passes through tool fields."""
-    tools = [{"type": "function", "function": {"name": "test", "parameters": {}}}]
     req = ChatCompletionRequest(
         model="gpt-4",
         messages=[],
-        tools=tools,
+        tools=_WEATHER_TOOLS,
         tool_choice="auto",
-        response_format={"type": "json_object"},
+        response_format=_JSON_OBJECT_FORMAT,
     )
     data = req.model_dump()
-    assert "tools" in data
-    assert "tool_choice" in data
-    assert "response_format" in data
+    assert data["tools"] == _WEATHER_TOOLS
+    assert data["tool_choice"] == "auto"
+    assert data["response_format"] == _JSON_OBJECT_FORMAT
@@ -1,18 +1,25 @@
-"""Tests for LLM Gateway server."""
+"""Tests for the LLM Gateway controller server."""
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from pydantic_core import from_json
+
+from llm_gateway.controller.server import app
 
-from llm_gateway.server import app
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create test client."""
-    return TestClient(app)
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """Create a test client shared by every test in this module."""
+    with TestClient(app) as c:
+        yield c
 
 
 def test_health_check(client: TestClient) -> None:
@@ -26,8 +33,8 @@ def test_root_endpoint(client: TestClient) -> None:
     """Test root endpoint."""
     response = client.get("/")
     assert response.status_code == 200
-    data = response.json()
-    assert data["name"] == "LLM Gateway"
+    data = from_json(response.content)
+    assert data["name"] == "LLM Gateway Controller"
     assert "endpoints" in data
 
 
@@ -35,24 +42,68 @@ def test_list_models(client: TestClient) -> None:
     """Test list models endpoint."""
     response = client.get("/v1/models")
     assert response.status_code == 200
-    data = response.json()
+    data = from_json(response.content)
     assert "data" in data
     assert isinstance(data["data"], list)
 
 
-@pytest.mark.asyncio
-async def test_chat_completion_validation() -> None:
+def test_chat_completion_validation(client: TestClient) -> None:
     """Test chat completion request validation."""
-    from httpx import ASGITransport
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        # Test missing required field
-        response = await ac.post("/v1/chat/completions", json={})
-        assert response.status_code == 422
-
-        # Test invalid model type
-        response = await ac.post(
-            "/v1/chat/completions",
-            json={"model": "gpt-4", "messages": "invalid"},
-        )
-        assert response.status_code == 422
+    # Test missing required field
+    response = client.post("/v1/chat/completions", json={})
+    assert response.status_code == 422
+
+    # Test invalid model type
+    response = client.post(
+        "/v1/chat/completions",
+        json={"model": "gpt-4", "messages": "invalid"},
+    )
+    assert response.status_code == 422
+
+    # Test out-of-range sampling parameter, rejected before any worker is chosen
+    response = client.post(
+        "/v1/chat/completions",
+        json={"model": "gpt-4", "temperature": 3, "messages": []},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "temperature"]
+
+
+def test_stream_client_error_passed_through(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a worker 4xx on a stream is relayed without tripping the breaker."""
+    error = b'{"error": {"message": "context too long"}}'
+    closed: list[bool] = []
+
+    class _Body(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield error
+
+        async def aclose(self) -> None:
+            closed.append(True)
+
+    def worker(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400, stream=_Body(), headers={"content-type": "application/json"})
+
+    monkeypatch.setattr(client.app.state.client, "_transport", httpx.MockTransport(worker))
+    client.post(
+        "/internal/workers/register",
+        json={"worker_id": "stream-4xx", "model_id": "stream-model", "endpoint": "http://w"},
+    )
+    body = {
+        "model": "stream-model",
+        "stream": True,
+        "messages": [{"role": "user", "content": "hi"}],
+    }
+
+    try:
+        for _ in range(6):
+            response = client.post("/v1/chat/completions", json=body)
+            assert response.status_code == 400
+            assert response.content == error
+        workers = client.get("/internal/workers").json()["workers"]
+        assert [w["circuit_state"] for w in workers if w["worker_id"] == "stream-4xx"] == ["closed"]
+        assert len(closed) == 6
+    finally:
+        client.delete("/internal/workers/stream-4xx", params={"force": True})
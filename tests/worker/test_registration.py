@@ -1,11 +1,43 @@
 """Tests for RegistrationClient."""
 
+from typing import Any
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
 from llm_gateway.worker.registration import RegistrationClient
 
 
+class _FakeResponse:
+    """Minimal stand-in for httpx.Response."""
+
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+    def json(self) -> dict[str, Any]:
+        return {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _FakeAsyncClient:
+    """In-process stand-in for httpx.AsyncClient that records requests."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.calls: list[tuple[str, str, Any]] = []
+
+    async def post(self, url: str, *, json: Any, **kwargs: Any) -> _FakeResponse:
+        self.calls.append(("POST", url, json))
+        return _FakeResponse(201 if url.endswith("/register") else 200)
+
+    async def delete(self, url: str, **kwargs: Any) -> _FakeResponse:
+        self.calls.append(("DELETE", url, None))
+        return _FakeResponse(200)
+
+    async def aclose(self) -> None:
+        pass
+
+
 @pytest.fixture
 def registration_client():
     """Create a registration client."""
@@ -22,43 +54,54 @@ def registration_client():
 
 
 @pytest.mark.asyncio
-async def test_start_registers_with_controller(registration_client):
+async def test_start_registers_with_controller(registration_client, monkeypatch):
     """Test that start registers with controller."""
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.post.return_value = MagicMock(status_code=201)
-        mock_client_class.return_value = mock_client
-
-        await registration_client.start()
-
-        mock_client.post.assert_called_once()
-        call_args = mock_client.post.call_args
-        assert "/internal/workers/register" in call_args[0][0]
-        assert call_args[1]["json"]["worker_id"] == "test-worker-001"
-
-        await registration_client.stop()
+    monkeypatch.setattr("llm_gateway.worker.registration.httpx.AsyncClient", _FakeAsyncClient)
+
+    await registration_client.start()
+    fake = registration_client._client
+
+    method, url, payload = fake.calls[0]
+    assert method == "POST"
+    assert url.endswith("/internal/workers/register")
+    assert payload["worker_id"] == "test-worker-001"
+
+    await registration_client.stop()
+
+
+@pytest.mark.parametrize(
+    ("ops", "expected"),
+    [
+        ([], 0),
+        (["inc"], 1),
+        (["inc", "inc"], 2),
+        (["inc", "inc", "dec"], 1),
+        (["dec", "dec"], 0),
+        (["dec", "inc"], 1),
+    ],
+)
+def test_load_tracking(registration_client, ops, expected):
+    """Test load tracking; unmatched decrements never push the load negative."""
+    for op in ops:
+        if op == "inc":
+            registration_client.increment_load()
+        else:
+            registration_client.decrement_load()
+    assert registration_client.current_load == expected
 
 
 @pytest.mark.asyncio
-async def test_increment_decrement_load(registration_client):
-    """Test load tracking."""
-    assert registration_client.current_load == 0
+async def test_send_heartbeat_reports_current_load(registration_client):
+    """Test that heartbeats carry the load at the time they are sent."""
+    fake = _FakeAsyncClient()
+    registration_client._client = fake
 
     registration_client.increment_load()
-    assert registration_client.current_load == 1
-
     registration_client.increment_load()
-    assert registration_client.current_load == 2
-
-    registration_client.decrement_load()
-    assert registration_client.current_load == 1
-
-
-@pytest.mark.asyncio
-async def test_load_never_negative(registration_client):
-    """Test that load never goes negative."""
-    registration_client.decrement_load()
-    assert registration_client.current_load == 0
+    await registration_client._send_heartbeat()
 
-    registration_client.decrement_load()
-    assert registration_client.current_load == 0
+    method, url, payload = fake.calls[-1]
+    assert method == "POST"
+    assert url == "http://localhost:8000/internal/workers/heartbeat"
+    assert payload["worker_id"] == "test-worker-001"
+    assert payload["current_load"] == 2
@@ -0,0 +1,73 @@
+"""Tests for the worker server."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from llm_gateway.worker import server
+from llm_gateway.worker.proxy import ProxyHandler
+from llm_gateway.worker.registration import RegistrationClient
+
+CAPACITY = 2
+
+
+@pytest.fixture
+def backend_gate():
+    """Event that holds backend streams open until set."""
+    return asyncio.Event()
+
+
+@pytest.fixture
+async def worker_client(backend_gate, monkeypatch):
+    """Client for the worker app, proxying to an in-process backend."""
+
+    async def hold_stream():
+        yield b'data: {"choices": []}\n\n'
+        await backend_gate.wait()
+        yield b"data: [DONE]\n\n"
+
+    async def backend(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=hold_stream())
+
+    registration_client = RegistrationClient(
+        worker_id="test-worker-001",
+        model_id="llama3",
+        controller_url="http://localhost:8000",
+        backend_url="http://backend",
+        capacity=CAPACITY,
+    )
+    proxy_handler = ProxyHandler(
+        backend_url="http://backend", registration_client=registration_client
+    )
+    proxy_handler._client = httpx.AsyncClient(
+        base_url="http://backend", transport=httpx.MockTransport(backend)
+    )
+    monkeypatch.setattr(server, "registration_client", registration_client, raising=False)
+    monkeypatch.setattr(server, "proxy_handler", proxy_handler, raising=False)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=server.app), base_url="http://worker"
+    ) as client:
+        yield client
+    await proxy_handler.stop()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_streams_over_capacity_are_rejected(worker_client, backend_gate):
+    """Test that streams reserve their slot before the response starts."""
+    body = {"model": "llama3", "messages": [{"role": "user", "content": "hi"}], "stream": True}
+    tasks = [
+        asyncio.create_task(worker_client.post("/v1/chat/completions", json=body))
+        for _ in range(CAPACITY + 1)
+    ]
+
+    done, _ = await asyncio.wait(tasks, timeout=2, return_when=asyncio.FIRST_COMPLETED)
+    assert [task.result().status_code for task in done] == [503]
+    assert server.registration_client.current_load == CAPACITY
+
+    backend_gate.set()
+    responses = await asyncio.gather(*tasks)
+
+    assert sorted(r.status_code for r in responses) == [200] * CAPACITY + [503]
+    assert server.registration_client.current_load == 0